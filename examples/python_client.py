@@ -5,29 +5,201 @@ This example demonstrates how to use the RTLCSS API service with Python.
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
-import hmac
 import hashlib
 import json
 import argparse
+import asyncio
+import concurrent.futures
+import glob
+import gzip
+import itertools
+import mmap
+import os
+import socket
+import stat
+import sys
+from types import MappingProxyType
 
+# Shared read-only default for requests sent without RTLCSS options
+_EMPTY_OPTIONS = MappingProxyType({})
+# What the serializers see in its place; never mutated
+_EMPTY_OPTIONS_JSON = {}
 
-class RtlcssApiClient:
+
+def _json_default(obj):
     """
-    Python client for the RTLCSS API service
+    Serialize read-only mappings such as _EMPTY_OPTIONS as JSON objects
     """
+    if obj is _EMPTY_OPTIONS:
+        return _EMPTY_OPTIONS_JSON
+    if isinstance(obj, MappingProxyType):
+        return dict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+try:
+    import orjson
+
+    def json_dumps(obj, sort_keys=False):
+        return orjson.dumps(obj, default=_json_default,
+                            option=orjson.OPT_SORT_KEYS if sort_keys else None)
+
+    json_loads = orjson.loads
+except ImportError:  # fall back to the standard library
+    def json_dumps(obj, sort_keys=False):
+        return json.dumps(obj, ensure_ascii=False, separators=(',', ':'),
+                          sort_keys=sort_keys, default=_json_default).encode('utf-8')
+
+    json_loads = json.loads
+
+try:
+    import httpx
+except ImportError:  # httpx is only needed for AsyncRtlcssApiClient
+    httpx = None
+
+try:
+    import aiofiles
+except ImportError:  # convert_files falls back to worker threads for file I/O
+    aiofiles = None
+
+try:
+    import h2  # noqa: F401 - enables HTTP/2 support in httpx
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Request bodies at least this large are gzip-compressed before sending
+COMPRESS_MIN_SIZE = 1024
+COMPRESS_LEVEL = 3
+
+# Maximum number of items the API accepts in one batch request
+BATCH_MAX_ITEMS = 50
+
+# Encoded CSS bytes per batch request, kept well under the API's JSON body
+# limit to leave headroom for the item framing and options
+BATCH_MAX_BYTES = 900 * 1024
+
+# Files at least this large are streamed with chunked encoding; smaller ones
+# are sent in one (possibly gzip-compressed) body with a Content-Length
+STREAM_MIN_SIZE = 1 << 20
+
+# Size, in characters, of each CSS chunk in a streamed request body
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Write buffer size, in bytes, for converted CSS output files
+OUTPUT_BUFFER_SIZE = 1 << 20
+
+# SHA-256 block size in bytes, used to pad the HMAC key
+HMAC_BLOCK_SIZE = 64
+
+
+class RtlcssApiError(Exception):
+    """
+    Error response returned by the RTLCSS API
+    """
+
+    def __init__(self, code, message, status):
+        """
+        :param code: API error code (e.g., INVALID_SIGNATURE)
+        :param message: Human-readable error message
+        :param status: HTTP status code
+        """
+        super().__init__(f"API Error ({code}): {message}")
+        self.code = code
+        self.message = message
+        self.status = status
+
+
+class StreamedCssBody:
+    """
+    JSON request body that streams a CSS file instead of loading it whole
+
+    The CSS string is JSON-escaped chunk by chunk as the file is read, so
+    only one chunk is held in memory. Iterating again re-reads the file,
+    which keeps the body replayable when a request is retried.
+    """
+
+    __slots__ = ("path", "options")
+
+    def __init__(self, path, options=None):
+        """
+        :param path: CSS file path
+        :param options: Optional RTLCSS configuration options
+        """
+        self.path = path
+        self.options = options
+
+    def __iter__(self):
+        options = self.options if self.options is not None else _EMPTY_OPTIONS
+        yield b'{"options":' + json_dumps(options) + b',"css":"'
+        # newline='' keeps line endings as-is, matching the bytes read_css sends
+        with open(self.path, 'r', encoding='utf-8', newline='') as f:
+            for chunk in iter(lambda: f.read(STREAM_CHUNK_SIZE), ''):
+                # Escaping is per character, so chunks can be encoded independently
+                yield json_dumps(chunk)[1:-1]
+        yield b'"}'
+
+
+class TcpTuningAdapter(HTTPAdapter):
+    """
+    HTTPAdapter whose pooled sockets disable Nagle's algorithm and enable
+    TCP keep-alive, so small signed requests are sent immediately and idle
+    pooled connections are kept healthy
+    """
+
+    socket_options = [
+        (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+        (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+    ]
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["socket_options"] = self.socket_options
+        super().init_poolmanager(*args, **kwargs)
+
+
+class RtlcssApiClientBase:
+    """
+    Credentials and request signing shared by the sync and async clients
+
+    Clients use ``__slots__`` so attribute lookups on the per-request path
+    skip the instance dictionary.
+    """
+
+    __slots__ = ("api_key", "api_secret", "api_url", "_secret_bytes", "_base_headers", "_ipad", "_opad",
+                 "_signing_contexts", "_cache")
     
-    def __init__(self, api_key, api_secret, api_url="https://rtlcss-api.example.com"):
+    def __init__(self, api_key, api_secret, api_url="https://rtlcss-api.example.com", cache=None):
         """
         Initialize the client with API credentials
         
         :param api_key: Your API key
         :param api_secret: Your API secret
         :param api_url: The base URL of the API service
+        :param cache: Optional mapping used to memoize conversions by content,
+                      e.g. a dict or a ``diskcache.Cache``
         """
         self.api_key = api_key
         self.api_secret = api_secret
         self.api_url = api_url.rstrip('/')
+        self._secret_bytes = api_secret.encode('utf-8')
+
+        # Precompute the HMAC-SHA256 inner/outer pad contexts for this secret;
+        # signing then only has to copy them instead of re-deriving the keys
+        key = self._secret_bytes
+        if len(key) > HMAC_BLOCK_SIZE:
+            key = hashlib.sha256(key).digest()
+        key = key.ljust(HMAC_BLOCK_SIZE, b'\0')
+        self._ipad = hashlib.sha256(bytes(b ^ 0x36 for b in key))
+        self._opad = hashlib.sha256(bytes(b ^ 0x5C for b in key))
+        self._signing_contexts = {}
+        self._cache = cache
+        self._base_headers = {
+            "Content-Type": "application/json",
+            "X-API-Key": api_key
+        }
         
     def create_signature(self, path, method, timestamp):
         """
@@ -38,17 +210,166 @@ class RtlcssApiClient:
         :param timestamp: Current timestamp in milliseconds
         :return: HMAC-SHA256 signature as a hex string
         """
-        payload = f"{path}|{method}|{timestamp}"
-        
-        # Create HMAC-SHA256 signature
-        signature = hmac.new(
-            key=self.api_secret.encode('utf-8'),
-            msg=payload.encode('utf-8'),
-            digestmod=hashlib.sha256
-        ).hexdigest()
-        
-        return signature
-        
+        # The "path|method|" prefix is constant per endpoint, so cache an inner
+        # context that has already absorbed it and only feed the timestamp
+        key = (path, method)
+        prefixed = self._signing_contexts.get(key)
+        if prefixed is None:
+            prefixed = self._ipad.copy()
+            prefixed.update(f"{path}|{method}|".encode('utf-8'))
+            self._signing_contexts[key] = prefixed
+
+        # HMAC-SHA256 from the precomputed pad contexts
+        inner = prefixed.copy()
+        inner.update(str(timestamp).encode('ascii'))
+        outer = self._opad.copy()
+        outer.update(inner.digest())
+        return outer.hexdigest()
+
+    def _signed_headers(self, path, method="POST"):
+        """
+        Build the per-request authentication headers
+
+        The static headers in ``_base_headers`` are attached to the
+        underlying HTTP client once, so only these two change per call.
+
+        :param path: Request path
+        :param method: HTTP method (e.g., GET, POST)
+        :return: Timestamp and signature headers as a dictionary
+        """
+        timestamp = time.time_ns() // 1_000_000
+        return {
+            "X-Timestamp": str(timestamp),
+            "X-Signature": self.create_signature(path, method, timestamp)
+        }
+
+    @staticmethod
+    def _cache_key(direction, chunks, options):
+        """
+        Build a content-addressed cache key for a conversion
+
+        :param direction: Conversion direction ("ltr-to-rtl" or "rtl-to-ltr")
+        :param chunks: Iterable of CSS content as UTF-8 bytes
+        :param options: Optional RTLCSS configuration options
+        :return: SHA-256 digest of the CSS, options and direction
+        """
+        digest = hashlib.sha256()
+        for chunk in chunks:
+            digest.update(chunk)
+        digest.update(b'|' + json_dumps(options or {}, sort_keys=True) + b'|' + direction.encode('ascii'))
+        return digest.digest()
+
+    @staticmethod
+    def _encode_body(body):
+        """
+        Serialize a JSON body, gzip-compressing it when large enough to pay off
+
+        :param body: JSON body
+        :return: Tuple of (encoded bytes, extra request headers)
+        """
+        data = json_dumps(body)
+        if len(data) < COMPRESS_MIN_SIZE:
+            return data, {}
+        return gzip.compress(data, compresslevel=COMPRESS_LEVEL), {"Content-Encoding": "gzip"}
+
+    @staticmethod
+    def _raise_for_error(response):
+        """
+        Raise an RtlcssApiError for a non-200 API response
+
+        :param response: requests or httpx response object
+        """
+        if response.status_code == 200:
+            return
+
+        error = None
+        if 'json' in response.headers.get('Content-Type', ''):
+            try:
+                error_data = json_loads(response.content)
+            except ValueError:
+                error_data = None
+            if isinstance(error_data, dict):
+                error = error_data.get("error") or {}
+
+        if not isinstance(error, dict):
+            body = response.content.decode('utf-8', 'replace')
+            raise RtlcssApiError("UNKNOWN_ERROR", f"{response.status_code} - {body}", response.status_code)
+
+        raise RtlcssApiError(
+            error.get("code", "UNKNOWN_ERROR"),
+            error.get("message", "Unknown error"),
+            response.status_code
+        )
+
+
+class RtlcssApiClient(RtlcssApiClientBase):
+    """
+    Python client for the RTLCSS API service
+
+    Requests go through a pooled keep-alive session, so repeated calls to
+    the same host reuse one connection instead of a new TCP/TLS handshake.
+    """
+
+    __slots__ = ("_session",)
+
+    def __init__(self, api_key, api_secret, api_url="https://rtlcss-api.example.com",
+                 pool_maxsize=10, cache=None):
+        """
+        Initialize the client with API credentials
+
+        :param api_key: Your API key
+        :param api_secret: Your API secret
+        :param api_url: The base URL of the API service
+        :param pool_maxsize: Maximum number of pooled connections per host
+        :param cache: Optional mapping used to memoize conversions by content
+        """
+        super().__init__(api_key, api_secret, api_url, cache)
+
+        # Only retry failures where the server cannot have processed the
+        # request; a read error or timeout after sending could double-convert
+        retry = Retry(
+            total=3,
+            read=0,
+            other=0,
+            backoff_factor=0.3,
+            status_forcelist=[502, 503, 504],
+            allowed_methods=frozenset(["POST"]),
+            # Hand the last 5xx response back so it raises RtlcssApiError
+            raise_on_status=False
+        )
+        adapter = TcpTuningAdapter(pool_connections=10, pool_maxsize=pool_maxsize, max_retries=retry)
+
+        self._session = requests.Session()
+        self._session.headers.update(self._base_headers)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """
+        Close the underlying connection pool
+        """
+        self._session.close()
+
+    def _signed_post(self, path, body):
+        """
+        Send a signed POST request to the API
+
+        :param path: Request path
+        :param body: JSON body
+        :return: API response as a dictionary
+        """
+        data, headers = self._encode_body(body)
+        headers.update(self._signed_headers(path))
+        response = self._session.post(f"{self.api_url}{path}", headers=headers, data=data, timeout=30)
+        self._raise_for_error(response)
+        return json_loads(response.content)
+
     def convert_ltr_to_rtl(self, css, options=None):
         """
         Convert CSS from LTR to RTL
@@ -57,39 +378,7 @@ class RtlcssApiClient:
         :param options: Optional RTLCSS configuration options
         :return: API response as a dictionary
         """
-        path = "/api/convert/ltr-to-rtl"
-        method = "POST"
-        timestamp = int(time.time() * 1000)
-        signature = self.create_signature(path, method, timestamp)
-        
-        # Prepare request
-        url = f"{self.api_url}{path}"
-        headers = {
-            "Content-Type": "application/json",
-            "X-API-Key": self.api_key,
-            "X-Timestamp": str(timestamp),
-            "X-Signature": signature
-        }
-        
-        data = {
-            "css": css,
-            "options": options or {}
-        }
-        
-        # Send request
-        response = requests.post(url, headers=headers, json=data, timeout=30)
-        
-        # Handle errors
-        if response.status_code != 200:
-            try:
-                error_data = response.json()
-                error_message = error_data.get("error", {}).get("message", "Unknown error")
-                error_code = error_data.get("error", {}).get("code", "UNKNOWN_ERROR")
-                raise Exception(f"API Error ({error_code}): {error_message}")
-            except (ValueError, KeyError):
-                raise Exception(f"API Error: {response.status_code} - {response.text}")
-        
-        return response.json()
+        return self._convert("ltr-to-rtl", css, options)
         
     def convert_rtl_to_ltr(self, css, options=None):
         """
@@ -99,39 +388,30 @@ class RtlcssApiClient:
         :param options: Optional RTLCSS configuration options
         :return: API response as a dictionary
         """
-        path = "/api/convert/rtl-to-ltr"
-        method = "POST"
-        timestamp = int(time.time() * 1000)
-        signature = self.create_signature(path, method, timestamp)
-        
-        # Prepare request (same as convert_ltr_to_rtl but with different path)
-        url = f"{self.api_url}{path}"
-        headers = {
-            "Content-Type": "application/json",
-            "X-API-Key": self.api_key,
-            "X-Timestamp": str(timestamp),
-            "X-Signature": signature
-        }
-        
-        data = {
+        return self._convert("rtl-to-ltr", css, options)
+
+    def _convert(self, direction, css, options):
+        """
+        Convert CSS, returning a cached response for previously seen input
+
+        :param direction: Conversion direction ("ltr-to-rtl" or "rtl-to-ltr")
+        :param css: CSS content to convert
+        :param options: Optional RTLCSS configuration options
+        :return: API response as a dictionary
+        """
+        if self._cache is not None:
+            key = self._cache_key(direction, (css.encode('utf-8'),), options)
+            result = self._cache.get(key)
+            if result is not None:
+                return result
+
+        result = self._signed_post(f"/api/convert/{direction}", {
             "css": css,
-            "options": options or {}
-        }
-        
-        # Send request
-        response = requests.post(url, headers=headers, json=data, timeout=30)
-        
-        # Handle errors
-        if response.status_code != 200:
-            try:
-                error_data = response.json()
-                error_message = error_data.get("error", {}).get("message", "Unknown error")
-                error_code = error_data.get("error", {}).get("code", "UNKNOWN_ERROR")
-                raise Exception(f"API Error ({error_code}): {error_message}")
-            except (ValueError, KeyError):
-                raise Exception(f"API Error: {response.status_code} - {response.text}")
-        
-        return response.json()
+            "options": options if options is not None else _EMPTY_OPTIONS
+        })
+        if self._cache is not None:
+            self._cache[key] = result
+        return result
     
     def test_connection(self):
         """
@@ -139,34 +419,387 @@ class RtlcssApiClient:
         
         :return: API response as a dictionary
         """
-        path = "/api/test"
-        method = "POST"
-        timestamp = int(time.time() * 1000)
-        signature = self.create_signature(path, method, timestamp)
-        
-        # Prepare request
-        url = f"{self.api_url}{path}"
-        headers = {
-            "Content-Type": "application/json",
-            "X-API-Key": self.api_key,
-            "X-Timestamp": str(timestamp),
-            "X-Signature": signature
-        }
-        
-        # Send request
-        response = requests.post(url, headers=headers, json={}, timeout=30)
-        
-        # Handle errors
-        if response.status_code != 200:
-            try:
-                error_data = response.json()
-                error_message = error_data.get("error", {}).get("message", "Unknown error")
-                error_code = error_data.get("error", {}).get("code", "UNKNOWN_ERROR")
-                raise Exception(f"API Error ({error_code}): {error_message}")
-            except (ValueError, KeyError):
-                raise Exception(f"API Error: {response.status_code} - {response.text}")
-        
-        return response.json()
+        return self._signed_post("/api/test", {})
+
+    def convert_batch(self, items):
+        """
+        Convert several CSS inputs in a single signed request
+
+        :param items: List of dictionaries with "direction", "css" and
+                      optional "options" keys (at most BATCH_MAX_ITEMS)
+        :return: List of conversion results, in input order
+        """
+        return self._signed_post("/api/convert/batch", {"items": items})["data"]["results"]
+
+    def convert_file(self, path, direction="ltr-to-rtl", options=None):
+        """
+        Convert a CSS file
+
+        Files of at least STREAM_MIN_SIZE bytes are streamed to the API with
+        chunked encoding; smaller files are read and sent in a single body.
+
+        :param path: CSS file path
+        :param direction: Conversion direction ("ltr-to-rtl" or "rtl-to-ltr")
+        :param options: Optional RTLCSS configuration options
+        :return: API response as a dictionary
+        """
+        if os.path.getsize(path) < STREAM_MIN_SIZE:
+            return self._convert(direction, read_css(path), options)
+
+        if self._cache is not None:
+            # Hash the file in chunks so a cache hit never loads it whole
+            with open(path, 'rb') as f:
+                key = self._cache_key(direction, iter(lambda: f.read(STREAM_CHUNK_SIZE), b''), options)
+            result = self._cache.get(key)
+            if result is not None:
+                return result
+
+        api_path = f"/api/convert/{direction}"
+        headers = self._signed_headers(api_path)
+        response = self._session.post(f"{self.api_url}{api_path}", headers=headers,
+                                      data=StreamedCssBody(path, options), timeout=30)
+        self._raise_for_error(response)
+        result = json_loads(response.content)
+        if self._cache is not None:
+            self._cache[key] = result
+        return result
+
+    def convert_many(self, items, direction="ltr-to-rtl", options=None, max_workers=16):
+        """
+        Convert several CSS strings in parallel using a thread pool
+
+        The pooled session is shared between worker threads, so requests
+        overlap without needing the async client. Items are pulled from
+        ``items`` lazily, keeping at most ``2 * max_workers`` submitted at
+        once, so a generator of file contents is never read all up front.
+
+        :param items: Iterable of CSS strings to convert
+        :param direction: Conversion direction ("ltr-to-rtl" or "rtl-to-ltr")
+        :param options: Optional RTLCSS configuration options
+        :param max_workers: Maximum number of requests in flight
+        :return: Generator of (index, API response) tuples in completion order
+        """
+        convert = self.convert_ltr_to_rtl if direction == "ltr-to-rtl" else self.convert_rtl_to_ltr
+        items = enumerate(items)
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+        pending = {}
+
+        def submit(count):
+            for index, css in itertools.islice(items, count):
+                pending[executor.submit(convert, css, options)] = index
+
+        try:
+            submit(max_workers * 2)
+            while pending:
+                done, _ = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in done:
+                    index = pending.pop(future)
+                    result = future.result()
+                    submit(1)
+                    yield index, result
+        finally:
+            # On error or early exit, drop queued work instead of waiting for it
+            executor.shutdown(wait=not pending, cancel_futures=True)
+
+
+class AsyncRtlcssApiClient(RtlcssApiClientBase):
+    """
+    Asynchronous Python client for the RTLCSS API service
+
+    Requests share a single httpx connection pool (HTTP/2 when the ``h2``
+    package is installed), so many conversions can be in flight at once.
+    """
+
+    __slots__ = ("_client",)
+
+    def __init__(self, api_key, api_secret, api_url="https://rtlcss-api.example.com", cache=None):
+        """
+        Initialize the client with API credentials
+
+        :param api_key: Your API key
+        :param api_secret: Your API secret
+        :param api_url: The base URL of the API service
+        :param cache: Optional mapping used to memoize conversions by content
+        """
+        if httpx is None:
+            raise ImportError("AsyncRtlcssApiClient requires httpx (pip install httpx)")
+
+        super().__init__(api_key, api_secret, api_url, cache)
+        self._client = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            base_url=self.api_url,
+            headers=self._base_headers,
+            timeout=30,
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64)
+        )
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def close(self):
+        """
+        Close the underlying connection pool
+        """
+        await self._client.aclose()
+
+    async def _signed_post(self, path, body):
+        """
+        Send a signed POST request to the API
+
+        :param path: Request path
+        :param body: JSON body
+        :return: API response as a dictionary
+        """
+        data, headers = self._encode_body(body)
+        headers.update(self._signed_headers(path))
+        response = await self._client.post(path, headers=headers, content=data)
+        self._raise_for_error(response)
+        return json_loads(response.content)
+
+    async def convert_ltr_to_rtl(self, css, options=None):
+        """
+        Convert CSS from LTR to RTL
+
+        :param css: CSS content to convert
+        :param options: Optional RTLCSS configuration options
+        :return: API response as a dictionary
+        """
+        return await self._convert("ltr-to-rtl", css, options)
+
+    async def convert_rtl_to_ltr(self, css, options=None):
+        """
+        Convert CSS from RTL to LTR
+
+        :param css: CSS content to convert
+        :param options: Optional RTLCSS configuration options
+        :return: API response as a dictionary
+        """
+        return await self._convert("rtl-to-ltr", css, options)
+
+    async def _convert(self, direction, css, options):
+        """
+        Convert CSS, returning a cached response for previously seen input
+
+        Lookups in caches other than a plain dict (e.g. ``diskcache.Cache``)
+        run in a worker thread so disk I/O does not block the event loop.
+
+        :param direction: Conversion direction ("ltr-to-rtl" or "rtl-to-ltr")
+        :param css: CSS content to convert
+        :param options: Optional RTLCSS configuration options
+        :return: API response as a dictionary
+        """
+        if self._cache is not None:
+            key = self._cache_key(direction, (css.encode('utf-8'),), options)
+            if isinstance(self._cache, dict):
+                result = self._cache.get(key)
+            else:
+                result = await asyncio.to_thread(self._cache.get, key)
+            if result is not None:
+                return result
+
+        result = await self._signed_post(f"/api/convert/{direction}", {
+            "css": css,
+            "options": options if options is not None else _EMPTY_OPTIONS
+        })
+        if isinstance(self._cache, dict):
+            self._cache[key] = result
+        elif self._cache is not None:
+            await asyncio.to_thread(self._cache.__setitem__, key, result)
+        return result
+
+    async def test_connection(self):
+        """
+        Test the API connection
+
+        :return: API response as a dictionary
+        """
+        return await self._signed_post("/api/test", {})
+
+    async def convert_batch(self, items):
+        """
+        Convert several CSS inputs in a single signed request
+
+        :param items: List of dictionaries with "direction", "css" and
+                      optional "options" keys (at most BATCH_MAX_ITEMS)
+        :return: List of conversion results, in input order
+        """
+        result = await self._signed_post("/api/convert/batch", {"items": items})
+        return result["data"]["results"]
+
+
+def read_css(path):
+    """
+    Read a CSS file, decoding straight from a memory map
+
+    Mapping the file lets the kernel serve it from the page cache, so the
+    only copy held by Python is the decoded string. Pipes and other
+    non-regular files cannot be mapped and are read normally.
+
+    :param path: CSS file path
+    :return: File contents as a string
+    """
+    with open(path, 'rb') as f:
+        file_stat = os.fstat(f.fileno())
+        if not stat.S_ISREG(file_stat.st_mode):
+            return f.read().decode('utf-8')
+        if file_stat.st_size == 0:
+            return ""
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return str(mapped, 'utf-8')
+
+
+def write_css(path, css):
+    """
+    Write converted CSS to a file through a large write buffer
+
+    The file is opened in binary mode and written as UTF-8 bytes, which
+    skips the text-mode encoding layer.
+
+    :param path: Output file path
+    :param css: CSS content to write
+    """
+    with open(path, 'wb', buffering=OUTPUT_BUFFER_SIZE) as f:
+        f.write(css.encode('utf-8'))
+
+
+async def read_css_async(path):
+    """
+    Read a CSS file without blocking the event loop
+
+    :param path: CSS file path
+    :return: File contents as a string
+    """
+    if aiofiles is None:
+        return await asyncio.to_thread(read_css, path)
+    async with aiofiles.open(path, 'rb') as f:
+        return (await f.read()).decode('utf-8')
+
+
+async def write_css_async(path, css):
+    """
+    Write converted CSS to a file without blocking the event loop
+
+    :param path: Output file path
+    :param css: CSS content to write
+    """
+    if aiofiles is None:
+        return await asyncio.to_thread(write_css, path, css)
+    async with aiofiles.open(path, 'wb', buffering=OUTPUT_BUFFER_SIZE) as f:
+        await f.write(css.encode('utf-8'))
+
+
+def group_batch_items(items, max_items=BATCH_MAX_ITEMS, max_bytes=BATCH_MAX_BYTES):
+    """
+    Group batch items so each request stays within the API's limits
+
+    A batch is closed once it holds ``max_items`` items or adding the next
+    item would push its JSON-encoded CSS past ``max_bytes``. An item larger
+    than ``max_bytes`` on its own is sent in a batch by itself.
+
+    :param items: Iterable of batch item dictionaries with a "css" key
+    :param max_items: Maximum number of items per batch
+    :param max_bytes: Maximum encoded CSS size per batch
+    :return: Generator of lists of items
+    """
+    batch = []
+    batch_size = 0
+    for item in items:
+        item_size = len(json_dumps(item["css"]))
+        if batch and (len(batch) >= max_items or batch_size + item_size > max_bytes):
+            yield batch
+            batch = []
+            batch_size = 0
+        batch.append(item)
+        batch_size += item_size
+    if batch:
+        yield batch
+
+
+def expand_inputs(pattern):
+    """
+    Expand an --input value into a list of CSS file paths
+
+    :param pattern: A file path, a directory, or a glob pattern
+    :return: Sorted list of file paths
+    """
+    if os.path.isdir(pattern):
+        return sorted(glob.glob(os.path.join(pattern, "*.css")))
+    if glob.has_magic(pattern):
+        return sorted(glob.glob(pattern))
+    return [pattern]
+
+
+def plan_outputs(paths, output_dir):
+    """
+    Map each input file to its output path in the output directory
+
+    :param paths: CSS file paths to convert
+    :param output_dir: Output directory
+    :return: List of (input path, output path) tuples, in input order
+    """
+    inputs = {os.path.realpath(path) for path in paths}
+    jobs = []
+    sources = {}
+    for path in paths:
+        output_path = os.path.join(output_dir, os.path.basename(path))
+        real_output = os.path.realpath(output_path)
+        if real_output in inputs:
+            raise Exception(f"Refusing to overwrite input file {path}; choose a different --output directory")
+        if real_output in sources:
+            raise Exception(f"{sources[real_output]} and {path} would both be written to {output_path}")
+        sources[real_output] = path
+        jobs.append((path, output_path))
+    return jobs
+
+
+async def convert_files(args, jobs, options, cache=None, concurrency=16, on_written=None):
+    """
+    Convert several CSS files concurrently into the output directory
+
+    Each file is read, converted and written in its own task, so disk I/O
+    for some files overlaps with in-flight requests for others. The first
+    failure cancels the files still in progress and is re-raised; files
+    written before it have already been passed to ``on_written``.
+
+    :param args: Parsed command-line arguments
+    :param jobs: List of (input path, output path) tuples from plan_outputs
+    :param options: Optional RTLCSS configuration options
+    :param cache: Optional mapping used to memoize conversions by content
+    :param concurrency: Maximum number of files in progress
+    :param on_written: Optional callback called with (input path, output path)
+                       as each file is written
+    :return: List of (input path, output path) tuples, in input order
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async with AsyncRtlcssApiClient(args.api_key, args.api_secret, args.api_url, cache=cache) as client:
+        convert = client.convert_ltr_to_rtl if args.direction == "ltr-to-rtl" else client.convert_rtl_to_ltr
+
+        async def convert_one(path, output_path):
+            async with semaphore:
+                css = await read_css_async(path)
+                result = await convert(css, options)
+                await write_css_async(output_path, result['data']['converted'])
+            if on_written is not None:
+                on_written(path, output_path)
+            return path, output_path
+
+        tasks = [asyncio.ensure_future(convert_one(path, output_path)) for path, output_path in jobs]
+        try:
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+        finally:
+            # Stop the remaining files before the client closes under them
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        for task in done:
+            if task.exception() is not None:
+                raise task.exception()
+        return [task.result() for task in tasks]
 
 
 def main():
@@ -177,16 +810,28 @@ def main():
     parser.add_argument("--api-key", required=True, help="API key for authentication")
     parser.add_argument("--api-secret", required=True, help="API secret for authentication")
     parser.add_argument("--api-url", default="https://rtlcss-api.example.com", help="Base URL of the API service")
-    parser.add_argument("--input", help="Input CSS file path")
-    parser.add_argument("--output", help="Output CSS file path")
+    parser.add_argument("--input", nargs="+", help="Input CSS file paths, directories, or glob patterns")
+    parser.add_argument("--output", help="Output CSS file path (directory when converting multiple files)")
     parser.add_argument("--direction", choices=["ltr-to-rtl", "rtl-to-ltr"], default="ltr-to-rtl", help="Conversion direction")
     parser.add_argument("--options", help="RTLCSS options as JSON")
+    parser.add_argument("--batch", action="store_true", help="Send multiple input files through the batch endpoint")
+    parser.add_argument("--cache-dir", help="Directory for an on-disk cache of conversion results (requires diskcache)")
     parser.add_argument("--test", action="store_true", help="Test the API connection")
     
     args = parser.parse_args()
     
+    # Reuse results for unchanged inputs across runs
+    cache = None
+    if args.cache_dir:
+        try:
+            import diskcache
+        except ImportError:
+            print("Error: --cache-dir requires diskcache (pip install diskcache)", file=sys.stderr)
+            sys.exit(1)
+        cache = diskcache.Cache(args.cache_dir)
+
     # Create client
-    client = RtlcssApiClient(args.api_key, args.api_secret, args.api_url)
+    client = RtlcssApiClient(args.api_key, args.api_secret, args.api_url, cache=cache)
     
     try:
         if args.test:
@@ -206,37 +851,88 @@ def main():
             except ValueError as e:
                 raise Exception(f"Invalid JSON for options: {e}")
         
-        # Read input CSS
-        css = None
-        if args.input:
-            with open(args.input, 'r', encoding='utf-8') as f:
-                css = f.read()
+        # Convert multiple files, directories or globs
+        if args.input and (len(args.input) > 1 or os.path.isdir(args.input[0]) or glob.has_magic(args.input[0])):
+            # Drop files matched by more than one pattern
+            paths = list({
+                os.path.realpath(path): path
+                for pattern in args.input for path in expand_inputs(pattern)
+            }.values())
+            if not paths:
+                raise Exception(f"No CSS files match {' '.join(args.input)}")
+            if not args.output:
+                raise Exception("--output directory is required when converting multiple files")
+
+            jobs = plan_outputs(paths, args.output)
+            os.makedirs(args.output, exist_ok=True)
+
+            def report(path, output_path):
+                print(f"Converted {path} -> {output_path}")
+
+            if httpx is not None and not args.batch:
+                # File reads and writes are pipelined with the requests
+                asyncio.run(convert_files(args, jobs, options, cache, on_written=report))
+            else:
+                if args.batch:
+                    items = (
+                        {
+                            "direction": args.direction,
+                            "css": read_css(path),
+                            "options": options if options is not None else _EMPTY_OPTIONS
+                        }
+                        for path in paths
+                    )
+                    results = []
+                    for batch in group_batch_items(items):
+                        results.extend(client.convert_batch(batch))
+                    converted = zip(jobs, (result['converted'] for result in results))
+                else:
+                    results = [None] * len(paths)
+                    for index, result in client.convert_many(
+                            (read_css(path) for path in paths), args.direction, options):
+                        results[index] = result['data']['converted']
+                    converted = zip(jobs, results)
+
+                for (path, output_path), converted_css in converted:
+                    write_css(output_path, converted_css)
+                    report(path, output_path)
+            return
+
+        if args.batch:
+            raise Exception("--batch requires multiple input files, a directory or a glob pattern")
+
+        if args.input and stat.S_ISREG(os.stat(args.input[0]).st_mode):
+            # Large regular files are streamed rather than read into memory
+            if os.path.getsize(args.input[0]) == 0:
+                raise Exception("No CSS content provided")
+            result = client.convert_file(args.input[0], args.direction, options)
         else:
-            # Read from stdin if no input file
-            import sys
-            if not sys.stdin.isatty():
+            if args.input:
+                # Pipes and FIFOs report no size, so read them in full
+                css = read_css(args.input[0])
+            elif not sys.stdin.isatty():
+                # Read from stdin if no input file
                 css = sys.stdin.read()
             else:
                 # Interactive mode
                 print("Enter CSS (press Ctrl+D when finished):")
                 css = sys.stdin.read()
-        
-        if not css:
-            raise Exception("No CSS content provided")
-        
-        # Convert CSS
-        if args.direction == "ltr-to-rtl":
-            result = client.convert_ltr_to_rtl(css, options)
-        else:  # rtl-to-ltr
-            result = client.convert_rtl_to_ltr(css, options)
+
+            if not css:
+                raise Exception("No CSS content provided")
+
+            # Convert CSS
+            if args.direction == "ltr-to-rtl":
+                result = client.convert_ltr_to_rtl(css, options)
+            else:  # rtl-to-ltr
+                result = client.convert_rtl_to_ltr(css, options)
         
         # Get converted CSS
         converted_css = result['data']['converted']
         
         # Write output
         if args.output:
-            with open(args.output, 'w', encoding='utf-8') as f:
-                f.write(converted_css)
+            write_css(args.output, converted_css)
             print(f"Converted CSS written to {args.output}")
             
             # Print stats
@@ -245,12 +941,18 @@ def main():
             print(f"Converted size: {stats['convertedSize']} bytes")
             print(f"Processing time: {stats['processingTimeMs']} ms")
         else:
-            # Write to stdout
-            print(converted_css)
+            # Write to stdout in one binary write
+            sys.stdout.buffer.write(converted_css.encode('utf-8'))
+            sys.stdout.buffer.write(b"\n")
+            sys.stdout.buffer.flush()
         
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
+    finally:
+        client.close()
+        if cache is not None:
+            cache.close()
 
 
 if __name__ == "__main__":
@@ -4,12 +4,21 @@ const convertService = require('../services/convert');
 const validatorService = require('../services/validator');
 const authMiddleware = require('../middleware/auth');
 const { handleCssUpload, cleanupUploads } = require('../middleware/upload');
-const { generalLimiter } = require('../middleware/rateLimit');
+const { generalLimiter, batchLimiter } = require('../middleware/rateLimit');
 const { validationError } = require('../utils/errors');
 const logger = require('../utils/logger');
 
 const router = express.Router();
 
+// Maximum number of conversions accepted in a single batch request
+const BATCH_MAX_ITEMS = 50;
+
+// Conversion functions by batch item direction
+const batchConverters = {
+  'ltr-to-rtl': convertService.ltrToRtl,
+  'rtl-to-ltr': convertService.rtlToLtr,
+};
+
 /**
  * Helper function to process conversion requests
  */
@@ -98,4 +107,95 @@ router.post(
   }
 );
 
+/**
+ * POST /api/convert/batch
+ * Convert several CSS inputs in one signed request
+ */
+router.post(
+  '/batch',
+  authMiddleware,
+  generalLimiter,
+  batchLimiter,
+  async (req, res, next) => {
+    logger.info('Processing batch conversion');
+    try {
+      const { items } = req.body;
+      if (!Array.isArray(items) || items.length === 0) {
+        return next(validationError('items must be a non-empty array', 'INVALID_BATCH'));
+      }
+      if (items.length > BATCH_MAX_ITEMS) {
+        return next(validationError(
+          `Too many items in batch. Maximum is ${BATCH_MAX_ITEMS}`,
+          'BATCH_TOO_LARGE'
+        ));
+      }
+
+      // Validate every item before converting any, so a bad item does not
+      // leave earlier conversions recorded against the API key
+      const conversions = [];
+      for (const [index, item] of items.entries()) {
+        if (!item || typeof item !== 'object' || Array.isArray(item)) {
+          return next(validationError(`Item ${index} must be an object`, 'INVALID_BATCH_ITEM'));
+        }
+
+        const conversionFunction = batchConverters[item.direction];
+        if (!conversionFunction) {
+          return next(validationError(
+            `Invalid direction for item ${index}: ${item.direction}`,
+            'INVALID_DIRECTION'
+          ));
+        }
+
+        if (typeof item.css !== 'string') {
+          return next(validationError(`Item ${index} css must be a string`, 'INVALID_CSS'));
+        }
+
+        let options = item.options;
+        if (typeof options === 'string') {
+          try {
+            options = JSON.parse(options);
+          } catch (e) {
+            return next(validationError(
+              `Invalid options format for item ${index}`,
+              'INVALID_OPTIONS_FORMAT'
+            ));
+          }
+        }
+        const rtlcssOptions = options
+          ? validatorService.validateRtlcssOptions(options)
+          : {};
+
+        conversions.push({ conversionFunction, css: item.css, rtlcssOptions });
+      }
+
+      const results = [];
+      for (const { conversionFunction, css, rtlcssOptions } of conversions) {
+        const result = await conversionFunction({
+          css,
+          rtlcssOptions,
+          apiKey: req.apiKey,
+        });
+        results.push({
+          converted: result.converted,
+          stats: result.stats,
+        });
+      }
+
+      res.json({
+        success: true,
+        data: {
+          results,
+        },
+        meta: {
+          service: 'rtlcss-api',
+          version: require('../../package.json').version,
+          timestamp: new Date().toISOString(),
+        },
+      });
+    } catch (error) {
+      next(error);
+    }
+  }
+);
+
 module.exports = router;
\ No newline at end of file
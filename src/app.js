@@ -44,6 +44,9 @@ app.use(helmet());
 app.use(cors(corsOptions));
 
 // Request parsing
+// Conversion routes take CSS in the JSON body, so allow the same size as
+// file uploads there; the general parser below skips already-parsed bodies
+app.use('/api/convert', express.json({ limit: config.get('upload.limits.fileSize') }));
 app.use(express.json({ limit: '1mb' }));
 app.use(express.urlencoded({ extended: true, limit: '1mb' }));
 app.use(security.validateContentType);
@@ -26,6 +26,17 @@ module.exports = (err, req, res, next) => {
     });
   }
   
+  // Handle body-parser size errors (JSON or urlencoded body over its limit)
+  if (err.type === 'entity.too.large') {
+    return res.status(413).json({
+      success: false,
+      error: {
+        code: 'REQUEST_TOO_LARGE',
+        message: 'Request body is too large',
+      },
+    });
+  }
+  
   // Handle Multer errors
   if (err.code === 'LIMIT_FILE_SIZE') {
     return res.status(400).json({
@@ -1,27 +1,56 @@
 const rateLimit = require('express-rate-limit');
+const { MemoryStore } = require('express-rate-limit');
 const config = require('config');
 const { tooManyRequests } = require('../utils/errors');
 
+const generalMax = config.get('rateLimit.max');
+const generalStore = new MemoryStore();
+
+const limiterKey = (req) => {
+  // If API key is available, use it as part of the rate limiting key
+  return req.apiKey ? `${req.ip}-${req.apiKey}` : req.ip;
+};
+
+const generalLimitExceeded = () => tooManyRequests(
+  `Too many requests from this IP. Please try again after ${Math.ceil(config.get('rateLimit.windowMs') / 60000)} minutes.`,
+  'RATE_LIMIT_EXCEEDED'
+);
+
 /**
  * Configure rate limiting by IP address
  */
 const generalLimiter = rateLimit({
   windowMs: config.get('rateLimit.windowMs'),
-  max: config.get('rateLimit.max'),
+  max: generalMax,
+  store: generalStore,
   standardHeaders: true,
   legacyHeaders: false,
   handler: (req, res, next) => {
-    next(tooManyRequests(
-      `Too many requests from this IP. Please try again after ${Math.ceil(config.get('rateLimit.windowMs') / 60000)} minutes.`,
-      'RATE_LIMIT_EXCEEDED'
-    ));
-  },
-  keyGenerator: (req) => {
-    // If API key is available, use it as part of the rate limiting key
-    return req.apiKey ? `${req.ip}-${req.apiKey}` : req.ip;
+    next(generalLimitExceeded());
   },
+  keyGenerator: limiterKey,
 });
 
+/**
+ * Charge batch requests against the general limit once per item. Runs after
+ * generalLimiter, which has already counted the request itself.
+ */
+const batchLimiter = async (req, res, next) => {
+  try {
+    const items = req.body && Array.isArray(req.body.items) ? req.body.items.length : 1;
+    const key = limiterKey(req);
+    for (let i = 1; i < items; i++) {
+      const { totalHits } = await generalStore.increment(key);
+      if (totalHits > generalMax) {
+        return next(generalLimitExceeded());
+      }
+    }
+    next();
+  } catch (error) {
+    next(error);
+  }
+};
+
 /**
  * Configure stricter rate limiting for auth endpoints
  */
@@ -40,6 +69,7 @@ const authLimiter = rateLimit({
 
 module.exports = {
   generalLimiter,
+  batchLimiter,
   authLimiter,
   // Also export as a property for backwards compatibility
   rateLimiter: generalLimiter
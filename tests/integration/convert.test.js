@@ -139,6 +139,27 @@ describe('Convert API Integration Tests', () => {
     });
   });
   
+  describe('POST /api/convert/ltr-to-rtl with a large body', () => {
+    it('should accept a JSON body over 1 MB', async () => {
+      const timestamp = Date.now();
+      const path = '/api/convert/ltr-to-rtl';
+      const signature = createSignature(path, 'POST', timestamp);
+      
+      const css = '.test { margin-left: 10px; }\n'.repeat(40000);
+      
+      const response = await request(app)
+        .post(path)
+        .set('X-API-Key', apiKey)
+        .set('X-Timestamp', timestamp)
+        .set('X-Signature', signature)
+        .send({ css });
+      
+      expect(response.status).toBe(200);
+      expect(response.body.success).toBe(true);
+      expect(response.body.data.converted).toContain('margin-right: 10px');
+    });
+  });
+  
   describe('POST /api/convert/rtl-to-ltr', () => {
     it('should convert CSS from RTL to LTR', async () => {
       const timestamp = Date.now();
@@ -173,4 +194,102 @@ describe('Convert API Integration Tests', () => {
       expect(converted).toContain('float: left');
     });
   });
-});
\ No newline at end of file
+  
+  describe('POST /api/convert/batch', () => {
+    it('should convert several CSS inputs in one request', async () => {
+      const timestamp = Date.now();
+      const path = '/api/convert/batch';
+      const signature = createSignature(path, 'POST', timestamp);
+      
+      const items = [
+        { direction: 'ltr-to-rtl', css: '.a { margin-left: 10px; }' },
+        { direction: 'rtl-to-ltr', css: '.b { padding-right: 20px; }' },
+      ];
+      
+      const response = await request(app)
+        .post(path)
+        .set('X-API-Key', apiKey)
+        .set('X-Timestamp', timestamp)
+        .set('X-Signature', signature)
+        .send({ items });
+      
+      expect(response.status).toBe(200);
+      expect(response.body.success).toBe(true);
+      expect(response.body.data.results).toHaveLength(2);
+      expect(response.body.data.results[0].converted).toContain('margin-right: 10px');
+      expect(response.body.data.results[1].converted).toContain('padding-left: 20px');
+    });
+    
+    it('should return error for an invalid direction', async () => {
+      const timestamp = Date.now();
+      const path = '/api/convert/batch';
+      const signature = createSignature(path, 'POST', timestamp);
+      
+      const response = await request(app)
+        .post(path)
+        .set('X-API-Key', apiKey)
+        .set('X-Timestamp', timestamp)
+        .set('X-Signature', signature)
+        .send({ items: [{ direction: 'up-to-down', css: '.a { margin-left: 10px; }' }] });
+      
+      expect(response.status).toBe(422);
+      expect(response.body.success).toBe(false);
+      expect(response.body.error.code).toBe('INVALID_DIRECTION');
+    });
+    
+    it('should reject a batch containing a null item', async () => {
+      const timestamp = Date.now();
+      const path = '/api/convert/batch';
+      const signature = createSignature(path, 'POST', timestamp);
+      
+      const response = await request(app)
+        .post(path)
+        .set('X-API-Key', apiKey)
+        .set('X-Timestamp', timestamp)
+        .set('X-Signature', signature)
+        .send({ items: [{ direction: 'ltr-to-rtl', css: '.a { margin-left: 10px; }' }, null] });
+      
+      expect(response.status).toBe(422);
+      expect(response.body.success).toBe(false);
+      expect(response.body.error.code).toBe('INVALID_BATCH_ITEM');
+    });
+    
+    it('should accept batch item options as a JSON string', async () => {
+      const timestamp = Date.now();
+      const path = '/api/convert/batch';
+      const signature = createSignature(path, 'POST', timestamp);
+      
+      const response = await request(app)
+        .post(path)
+        .set('X-API-Key', apiKey)
+        .set('X-Timestamp', timestamp)
+        .set('X-Signature', signature)
+        .send({
+          items: [{
+            direction: 'ltr-to-rtl',
+            css: '.a { margin-left: 10px; }',
+            options: JSON.stringify({ autoRename: false })
+          }]
+        });
+      
+      expect(response.status).toBe(200);
+      expect(response.body.data.results[0].converted).toContain('margin-right');
+    });
+    
+    it('should reject batch item options that are not valid JSON', async () => {
+      const timestamp = Date.now();
+      const path = '/api/convert/batch';
+      const signature = createSignature(path, 'POST', timestamp);
+      
+      const response = await request(app)
+        .post(path)
+        .set('X-API-Key', apiKey)
+        .set('X-Timestamp', timestamp)
+        .set('X-Signature', signature)
+        .send({ items: [{ direction: 'ltr-to-rtl', css: '.a { margin-left: 10px; }', options: '{not json' }] });
+      
+      expect(response.status).toBe(422);
+      expect(response.body.error.code).toBe('INVALID_OPTIONS_FORMAT');
+    });
+  });
+});